@@ -164,7 +164,8 @@ if [[ "$RUST_ONLY" != true ]]; then
             PYTHON_ITERATIONS=2
         fi
 
-        python3 "$SCRIPT_DIR/compare_python.py" "$FIXTURES_DIR" -i "$PYTHON_ITERATIONS" -o "$SCRIPT_DIR/python_results.md"
+        # Fixed hash seed so set/dict hashing is identical between runs
+        PYTHONHASHSEED=0 python3 "$SCRIPT_DIR/compare_python.py" "$FIXTURES_DIR" -i "$PYTHON_ITERATIONS" -o "$SCRIPT_DIR/python_results.md"
 
         if [[ -f "$SCRIPT_DIR/python_results.md" ]]; then
             echo "" >> "$OUTPUT_FILE"
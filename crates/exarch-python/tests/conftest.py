@@ -1,26 +1,48 @@
 """Pytest configuration for exarch-python integration tests."""
 
+import importlib.util
 import io
+import os
 import tarfile
-import tempfile
 from pathlib import Path
 
 import pytest
 
+TMPFS_ROOT = Path("/dev/shm")
 
-@pytest.fixture
-def temp_dir():
-    """Create a temporary directory for test outputs."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
+
+def pytest_configure(config):
+    """Put pytest's temp root on tmpfs when `EXARCH_TMPFS=1`.
+
+    Extraction tests then create, write and unlink files without touching the
+    block layer. Only the root moves: pytest keeps its numbered, per-session
+    `pytest-of-<user>/pytest-N` layout, so concurrent sessions do not clean up
+    each other's directories. An explicit `--basetemp` or
+    `PYTEST_DEBUG_TEMPROOT` always wins, and xdist workers inherit a
+    per-worker subdirectory from the controller.
+    """
+    if config.option.basetemp is not None or hasattr(config, "workerinput"):
+        return
+    if os.environ.get("EXARCH_TMPFS") != "1" or not TMPFS_ROOT.is_dir():
+        return
+    os.environ.setdefault("PYTEST_DEBUG_TEMPROOT", str(TMPFS_ROOT))
 
 
 @pytest.fixture
-def sample_tar_gz(temp_dir):
-    """Create a sample TAR.GZ archive for testing."""
-    archive_path = temp_dir / "sample.tar.gz"
+def temp_dir(tmp_path):
+    """Return a fresh, per-test temporary directory for test outputs."""
+    return tmp_path
 
-    with tarfile.open(archive_path, "w:gz") as tar:
+
+@pytest.fixture(scope="session")
+def sample_tar_gz(tmp_path_factory):
+    """Create a sample TAR.GZ archive for testing (session-scoped, read-only)."""
+    archive_path = tmp_path_factory.mktemp("archives") / "sample.tar.gz"
+
+    # Encode in memory and write once, instead of layering tarfile's buffered
+    # writer over a file object
+    buf = io.BytesIO()
+    with tarfile.open(fileobj=buf, mode="w:gz") as tar:
         # Add a simple text file
         file_data = b"Hello, World!"
         tarinfo = tarfile.TarInfo(name="hello.txt")
@@ -38,6 +60,7 @@ def sample_tar_gz(temp_dir):
         nested_info.size = len(nested_data)
         tar.addfile(nested_info, io.BytesIO(nested_data))
 
+    archive_path.write_bytes(buf.getvalue())
     return archive_path
 
 
@@ -50,46 +73,70 @@ def fixtures_dir():
     return path
 
 
-@pytest.fixture
+# CVE fixture file name -> generate_fixtures.py function that builds it
+CVE_FIXTURES = {
+    "cve-2025-4517-traversal.tar.gz": "create_path_traversal_archive",
+    "cve-2024-12905-symlink-escape.tar": "create_symlink_escape_archive",
+    "cve-2025-48387-hardlink.tar": "create_hardlink_escape_archive",
+}
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _ensure_cve_fixtures(fixtures_dir):
+    """Generate missing or stale CVE fixtures once per test session.
+
+    A fixture is stale if it is older than `generate_fixtures.py`. The
+    payloads are embedded in the script, so a stale file that cannot be
+    rewritten (e.g. a read-only checkout) is used as-is.
+    """
+    generator_path = fixtures_dir / "generate_fixtures.py"
+    generator_mtime = generator_path.stat().st_mtime
+    stale = [
+        (name, builder)
+        for name, builder in CVE_FIXTURES.items()
+        if not (fixtures_dir / name).exists()
+        or (fixtures_dir / name).stat().st_mtime < generator_mtime
+    ]
+    if not stale:
+        return
+
+    spec = importlib.util.spec_from_file_location("generate_fixtures", generator_path)
+    generator = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(generator)
+    for name, builder in stale:
+        try:
+            getattr(generator, builder)()
+        except OSError:
+            if not (fixtures_dir / name).exists():
+                raise
+
+
+@pytest.fixture(scope="session")
 def malicious_traversal_tar(fixtures_dir):
     """Return path to CVE-2025-4517 path traversal test archive."""
-    path = fixtures_dir / "cve-2025-4517-traversal.tar.gz"
-    if not path.exists():
-        pytest.fail(
-            f"Test fixture missing: {path}. Run: python tests/fixtures/generate_fixtures.py"
-        )
-    return path
+    return fixtures_dir / "cve-2025-4517-traversal.tar.gz"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def malicious_symlink_escape(fixtures_dir):
     """Return path to CVE-2024-12905 symlink escape test archive."""
-    path = fixtures_dir / "cve-2024-12905-symlink-escape.tar"
-    if not path.exists():
-        pytest.fail(
-            f"Test fixture missing: {path}. Run: python tests/fixtures/generate_fixtures.py"
-        )
-    return path
+    return fixtures_dir / "cve-2024-12905-symlink-escape.tar"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def malicious_hardlink_escape(fixtures_dir):
     """Return path to CVE-2025-48387 hardlink escape test archive."""
-    path = fixtures_dir / "cve-2025-48387-hardlink.tar"
-    if not path.exists():
-        pytest.fail(
-            f"Test fixture missing: {path}. Run: python tests/fixtures/generate_fixtures.py"
-        )
-    return path
+    return fixtures_dir / "cve-2025-48387-hardlink.tar"
 
 
-@pytest.fixture
-def corrupted_archive(temp_dir):
-    """Create a corrupted archive file."""
-    archive_path = temp_dir / "corrupted.tar.gz"
+@pytest.fixture(scope="session")
+def corrupted_archive(tmp_path_factory):
+    """Create a corrupted archive file (session-scoped, read-only)."""
+    archive_path = tmp_path_factory.mktemp("archives") / "corrupted.tar.gz"
 
     # Write garbage data to simulate corruption
-    with open(archive_path, "wb") as f:
-        f.write(b"\x1f\x8b\x08\x00" + b"corrupted data that is not a valid gzip stream" * 100)
+    archive_path.write_bytes(
+        b"\x1f\x8b\x08\x00" + b"corrupted data that is not a valid gzip stream" * 100
+    )
 
     return archive_path
@@ -3,50 +3,85 @@
 
 This script creates malicious test archives that demonstrate known CVE attack vectors.
 These archives are used in CVE regression tests to verify exarch blocks these attacks.
+
+The archives are fixed, so their bytes are embedded below (base85, trailing NUL
+padding stripped) rather than re-encoded with `tarfile`/`gzip` on every run.
+This also keeps regenerated files byte-identical to the committed ones (the
+gzip header would otherwise embed the current time).
 """
 
-import io
-import tarfile
+import base64
+import os
+import tempfile
 from pathlib import Path
 
+# TAR.GZ: one 17-byte regular file named "../../../etc/passwd"
+_TRAVERSAL_TAR_GZ = (
+    b"ABzYGQHxe-0{>%nWi2u=GBqtUH8D3WbaG*KWpZ<2Y%X+RaschkNeX~45Jb^FiYJJzIGiU$7l"
+    b"IQe;`NPg1lJ;n|4~p)Z_1d|oN0qgXY2je$kQ~cisJ0(-l}<a-N!%EvaTdidBN&~UE;j_(_s6"
+    b"~b<^q-H;thkg8%>k00000000000002KU<Xv55IO)T"
+)
+_TRAVERSAL_TAR_GZ_SIZE = 150
+
+# TAR: symlink "evil_link" -> "/etc/passwd"
+_SYMLINK_ESCAPE_TAR = (
+    b"Wp-(7Uu<b^YXATM000000000000000000000000000000000000000000000000000000000"
+    b"00000000000000000000000000000000000000000000000000000FfcGMHZ(K<FfcGMFfcF"
+    b"xFfcGMFfcFxFfcGMFfcGMFfcFxFfcGMFfcGMFfcFxFflPVF)#oiGB0IxV=r)Fb8~lO000000"
+    b"000000000000000000000000000000000000000000000000000000000000000000000000"
+    b"000000000000000000000000000000000CjV8VR8U4Fa"
+)
+_SYMLINK_ESCAPE_TAR_SIZE = 10240
+
+# TAR: hardlink "evil_hardlink" -> "/etc/passwd"
+_HARDLINK_ESCAPE_TAR = (
+    b"Wp-(7Uua=+WNc|}YXATM0000000000000000000000000000000000000000000000000000"
+    b"00000000000000000000000000000000000000000000000000000FfcGMHZ(K<FfcGMFfcF"
+    b"xFfcGMFfcFxFfcGMFfcGMFfcFxFfcGMFfcGMFfcFxFflSUG&TSrF)w9wV=r)Fb8~lO000000"
+    b"000000000000000000000000000000000000000000000000000000000000000000000000"
+    b"000000000000000000000000000000000CjV8VR8U4Fa"
+)
+_HARDLINK_ESCAPE_TAR_SIZE = 10240
+
+
+def _write_payload(name: str, payload: bytes, size: int) -> None:
+    """Decode a base85 payload and write it, NUL-padded back to `size` bytes.
+
+    Written to a temp file and renamed into place so that parallel test
+    workers (pytest-xdist) regenerating the same fixture never observe a
+    partially written archive.
+    """
+    archive_path = Path(__file__).parent / name
+    fd, tmp = tempfile.mkstemp(dir=archive_path.parent, prefix=f".{name}.")
+    try:
+        # mkstemp creates 0600 files; give the fixture the usual umask-derived mode
+        umask = os.umask(0)
+        os.umask(umask)
+        os.fchmod(fd, 0o644 & ~umask)
+        with os.fdopen(fd, "wb") as f:
+            f.write(base64.b85decode(payload).ljust(size, b"\0"))
+        os.replace(tmp, archive_path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+    print(f"Created: {archive_path}")
+
 
 def create_path_traversal_archive():
     """Create CVE-2025-4517 path traversal test archive."""
-    archive_path = Path(__file__).parent / "cve-2025-4517-traversal.tar.gz"
-
-    with tarfile.open(archive_path, "w:gz") as tar:
-        data = b"malicious content"
-        info = tarfile.TarInfo(name="../../../etc/passwd")
-        info.size = len(data)
-        tar.addfile(info, io.BytesIO(data))
-
-    print(f"Created: {archive_path}")
+    _write_payload("cve-2025-4517-traversal.tar.gz", _TRAVERSAL_TAR_GZ, _TRAVERSAL_TAR_GZ_SIZE)
 
 
 def create_symlink_escape_archive():
     """Create CVE-2024-12905 symlink escape test archive."""
-    archive_path = Path(__file__).parent / "cve-2024-12905-symlink-escape.tar"
-
-    with tarfile.open(archive_path, "w") as tar:
-        info = tarfile.TarInfo(name="evil_link")
-        info.type = tarfile.SYMTYPE
-        info.linkname = "/etc/passwd"
-        tar.addfile(info)
-
-    print(f"Created: {archive_path}")
+    _write_payload(
+        "cve-2024-12905-symlink-escape.tar", _SYMLINK_ESCAPE_TAR, _SYMLINK_ESCAPE_TAR_SIZE
+    )
 
 
 def create_hardlink_escape_archive():
     """Create CVE-2025-48387 hardlink traversal test archive."""
-    archive_path = Path(__file__).parent / "cve-2025-48387-hardlink.tar"
-
-    with tarfile.open(archive_path, "w") as tar:
-        info = tarfile.TarInfo(name="evil_hardlink")
-        info.type = tarfile.LNKTYPE
-        info.linkname = "/etc/passwd"
-        tar.addfile(info)
-
-    print(f"Created: {archive_path}")
+    _write_payload("cve-2025-48387-hardlink.tar", _HARDLINK_ESCAPE_TAR, _HARDLINK_ESCAPE_TAR_SIZE)
 
 
 if __name__ == "__main__":